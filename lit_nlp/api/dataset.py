@@ -14,7 +14,9 @@
 # ==============================================================================
 # Lint as: python3
 """Base classes for LIT models."""
+import functools
 import inspect
+import itertools
 import random
 from typing import List, Dict, Optional
 
@@ -22,6 +24,7 @@ from absl import logging
 
 from lit_nlp.api import types
 from lit_nlp.lib import utils
+import numpy as np
 
 JsonDict = types.JsonDict
 Spec = types.Spec
@@ -62,7 +65,14 @@ class Dataset(object):
     Returns:
       (string) A human-readable description for display in the UI.
     """
-    return self._description or inspect.getdoc(self) or ''  # pytype: disable=bad-return-type
+    return self._description or self._class_doc()
+
+  @classmethod
+  @functools.lru_cache(maxsize=None)
+  def _class_doc(cls) -> str:
+    """Class docstring, cached since it doesn't change at runtime."""
+    # Only use the class's own docstring, not one inherited from a base class.
+    return inspect.cleandoc(cls.__doc__) if cls.__doc__ else ''
 
   def spec(self) -> Spec:
     """Return a spec describing dataset elements."""
@@ -85,22 +95,97 @@ class Dataset(object):
 
     return SliceWrapper(_slicer)
 
-  def sample(self, n, seed=42):
-    """Return a new dataset with a random subset of examples."""
-    rng = random.Random(seed)
-    if n < len(self.examples):
-      examples = rng.sample(self.examples, n)
+  def sample(self, n, seed=42, preserve_random_order=False,
+             legacy_random=False):
+    """Return a new dataset with a random subset of examples.
+
+    By default, sampled examples are kept in their original order, which
+    keeps reads from the underlying examples sequential. Use shuffle() for a
+    full random ordering.
+
+    Args:
+      n: number of examples to sample
+      seed: random seed
+      preserve_random_order: if true, return examples in the order they were
+        drawn rather than in dataset order.
+      legacy_random: if true, use Python's random.Random instead of NumPy, to
+        reproduce the exact samples of earlier versions for a given seed.
+        Examples are always returned in the order drawn.
+
+    Returns:
+      new Dataset with a random subset of examples
+    """
+    # Subclasses may compute examples on the fly, so only access them once.
+    all_examples = self.examples
+    if n < len(all_examples):
+      if legacy_random:
+        examples = random.Random(seed).sample(all_examples, n)
+      else:
+        rng = np.random.default_rng(seed)
+        idxs = rng.choice(len(all_examples), size=n, replace=False)
+        if not preserve_random_order:
+          idxs.sort()
+        examples = [all_examples[i] for i in idxs.tolist()]
     else:
       logging.warning(
           'Requested sample %d is larger than dataset size %d; returning full dataset.',
-          n, len(self.examples))
-      examples = list(self.examples)
+          n, len(all_examples))
+      examples = list(all_examples)
     return Dataset(self.spec(), examples, self.description())
 
+  def sample_buffered(self, n, buffer_size=10000, seed=42):
+    """Return a new dataset with a random subset of examples, in one pass.
+
+    Unlike sample(), this makes a single sequential pass over self.examples
+    and never needs the full dataset in memory, so it also works when examples
+    are streamed from disk. It uses reservoir sampling (Algorithm R), so every
+    example in the dataset is equally likely to be chosen. Memory use is
+    O(n + buffer_size).
+
+    Args:
+      n: number of examples to sample
+      buffer_size: number of examples to read, and draw random indices for, at
+        a time
+      seed: random seed
+
+    Returns:
+      new Dataset with a random subset of examples, in no particular order
+
+    Raises:
+      ValueError: if buffer_size is less than 1.
+    """
+    if buffer_size < 1:
+      raise ValueError(f'buffer_size must be at least 1, got {buffer_size}.')
+    rng = np.random.default_rng(seed)
+    stream = iter(self.examples)
+    reservoir = list(itertools.islice(stream, n))
+    if len(reservoir) < n:
+      logging.warning(
+          'Requested sample %d is larger than dataset size %d; returning full '
+          'dataset.', n, len(reservoir))
+      return Dataset(self.spec(), reservoir, self.description())
+
+    num_seen = n
+    while True:
+      batch = list(itertools.islice(stream, buffer_size))
+      if not batch:
+        break
+      # The i-th example (0-based) draws a slot in [0, i], and so replaces a
+      # reservoir entry with probability n / (i + 1).
+      highs = np.arange(num_seen + 1, num_seen + len(batch) + 1)
+      slots = rng.integers(highs).tolist()
+      for slot, ex in zip(slots, batch):
+        if slot < n:
+          reservoir[slot] = ex
+      num_seen += len(batch)
+    return Dataset(self.spec(), reservoir, self.description())
+
   def shuffle(self, seed=42):
     """Return a new dataset with randomized example order."""
-    # random.shuffle will shuffle in-place; use sample to make a new list.
-    return self.sample(n=len(self), seed=seed)
+    all_examples = self.examples
+    idxs = np.random.default_rng(seed).permutation(len(all_examples))
+    examples = [all_examples[i] for i in idxs.tolist()]
+    return Dataset(self.spec(), examples, self.description())
 
   def remap(self, field_map: Dict[str, str]):
     """Return a copy of this dataset with some fields renamed."""
@@ -15,14 +15,38 @@
 # Lint as: python3
 """Tests for lit_nlp.lib.model."""
 
+import collections
+import inspect
+import random
+
 from absl.testing import absltest
 
 from lit_nlp.api import dataset as lit_dataset
 from lit_nlp.api import types
+import numpy as np
 
 
 class DatasetTest(absltest.TestCase):
 
+  def test_description(self):
+    """Test description method."""
+
+    class SubDataset(lit_dataset.Dataset):
+      """Sub-dataset docstring."""
+
+    self.assertEqual("Sub-dataset docstring.",
+                     SubDataset({}, []).description())
+    self.assertEqual("Custom.", SubDataset({}, [], "Custom.").description())
+    self.assertEqual(
+        inspect.getdoc(lit_dataset.Dataset),
+        lit_dataset.Dataset({}, []).description())
+
+    class NoDocDataset(lit_dataset.Dataset):
+      pass
+
+    # Docstrings are not inherited from the base class.
+    self.assertEqual("", NoDocDataset({}, []).description())
+
   def test_remap(self):
     """Test remap method."""
     spec = {
@@ -46,6 +70,109 @@ class DatasetTest(absltest.TestCase):
     self.assertNotIn("score", remapped_dset.spec())
     self.assertEqual({"val": 0, "text": "a"}, remapped_dset.examples[0])
 
+  def test_remap_mixed_fields(self):
+    """Test remap on examples which don't all have the same fields."""
+    spec = {
+        "score": types.Scalar(),
+        "text": types.TextSegment(required=False),
+    }
+    datapoints = [{"score": 0, "text": "a"}, {"score": 1}]
+    dset = lit_dataset.Dataset(spec, datapoints)
+    remapped_dset = dset.remap({"score": "val"})
+    self.assertEqual([{"val": 0, "text": "a"}, {"val": 1}],
+                     remapped_dset.examples)
+    self.assertEqual([], lit_dataset.Dataset(spec, []).remap({}).examples)
+
+  def test_sample(self):
+    """Test sample method."""
+    spec = {"val": types.Scalar()}
+    datapoints = [{"val": i} for i in range(10)]
+    dset = lit_dataset.Dataset(spec, datapoints)
+    sampled_dset = dset.sample(4, seed=0)
+    self.assertLen(sampled_dset, 4)
+    self.assertLen({ex["val"] for ex in sampled_dset.examples}, 4)
+    for ex in sampled_dset.examples:
+      self.assertIn(ex, datapoints)
+    # Sampled examples keep dataset order unless asked otherwise.
+    self.assertEqual(
+        sorted(sampled_dset.examples, key=lambda ex: ex["val"]),
+        sampled_dset.examples)
+    self.assertCountEqual(
+        sampled_dset.examples,
+        dset.sample(4, seed=0, preserve_random_order=True).examples)
+    # Same seed, same sample.
+    self.assertEqual(sampled_dset.examples, dset.sample(4, seed=0).examples)
+    # Legacy path matches random.Random.sample.
+    self.assertEqual(
+        random.Random(0).sample(datapoints, 4),
+        dset.sample(4, seed=0, legacy_random=True).examples)
+    # Requesting more than available returns the full dataset.
+    self.assertEqual(datapoints, dset.sample(20).examples)
+
+  def test_sample_buffered(self):
+    """Test sample_buffered method."""
+    spec = {"val": types.Scalar()}
+    datapoints = [{"val": i} for i in range(100)]
+    dset = lit_dataset.Dataset(spec, datapoints)
+    for buffer_size in [1, 10, 100, 1000]:
+      sampled_dset = dset.sample_buffered(20, buffer_size=buffer_size, seed=0)
+      self.assertLen(sampled_dset, 20)
+      self.assertLen({ex["val"] for ex in sampled_dset.examples}, 20)
+      for ex in sampled_dset.examples:
+        self.assertIn(ex, datapoints)
+    self.assertCountEqual(
+        dset.sample_buffered(20, seed=3).examples,
+        dset.sample_buffered(20, seed=3).examples)
+    # Requesting more than available returns the full dataset.
+    self.assertCountEqual(
+        datapoints, dset.sample_buffered(200, buffer_size=10).examples)
+    self.assertEqual(
+        [], lit_dataset.Dataset(spec, []).sample_buffered(5).examples)
+    for buffer_size in [0, -1]:
+      with self.assertRaises(ValueError):
+        dset.sample_buffered(5, buffer_size=buffer_size)
+
+  def test_sample_buffered_distribution(self):
+    """Test that sample_buffered samples from the whole dataset."""
+    spec = {"val": types.Scalar()}
+    dset = lit_dataset.Dataset(spec, [{"val": i} for i in range(10000)])
+    vals = [ex["val"] for ex in
+            dset.sample_buffered(1000, buffer_size=10, seed=0).examples]
+    self.assertGreater(max(vals), 1000 + 10)
+    self.assertBetween(np.mean(vals), 4500, 5500)
+    # With a tiny buffer, each example is still picked equally often.
+    small_dset = lit_dataset.Dataset(spec, [{"val": i} for i in range(10)])
+    counts = collections.Counter()
+    for seed in range(2000):
+      sampled_dset = small_dset.sample_buffered(2, buffer_size=1, seed=seed)
+      counts.update(ex["val"] for ex in sampled_dset.examples)
+    for val in range(10):
+      self.assertBetween(counts[val], 320, 480)
+
+  def test_shuffle(self):
+    """Test shuffle method."""
+    spec = {"val": types.Scalar()}
+    datapoints = [{"val": i} for i in range(10)]
+    dset = lit_dataset.Dataset(spec, datapoints)
+    shuffled_dset = dset.shuffle(seed=0)
+    self.assertCountEqual(datapoints, shuffled_dset.examples)
+    self.assertNotEqual(datapoints, shuffled_dset.examples)
+    self.assertEqual(shuffled_dset.examples, dset.shuffle(seed=0).examples)
+
+  def test_slice(self):
+    """Test slice method."""
+    spec = {"val": types.Scalar()}
+    datapoints = [{"val": i} for i in range(10)]
+    dset = lit_dataset.Dataset(spec, datapoints)
+    for slice_obj in [slice(2, 5), slice(None, None, 3), slice(-3, None),
+                      slice(None, None, -2), slice(8, 2)]:
+      sliced_dset = dset.slice[slice_obj]
+      self.assertIsInstance(sliced_dset.examples, list)
+      self.assertEqual(datapoints[slice_obj], sliced_dset.examples)
+    # Slices of slices.
+    self.assertEqual(datapoints[2:8][1::2],
+                     dset.slice[2:8].slice[1::2].examples)
+
 
 if __name__ == "__main__":
   absltest.main()
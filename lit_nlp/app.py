@@ -15,8 +15,9 @@
 # Lint as: python3
 """LIT backend, as a standard WSGI app."""
 
+import collections
+from concurrent import futures
 import functools
-import glob
 import os
 import pickle
 import random
@@ -73,12 +74,19 @@ def make_handler(fn):
         kw.pop('response_simple_json', True))
     data = serialize.from_json(request.data) if len(request.data) else None
     outputs = fn(data, **kw)
-    response_body = serialize.to_json(outputs, simple=response_simple_json)
+    response_body = serialize.to_json_bytes(
+        outputs, simple=response_simple_json)
     return handler.respond(request, response_body, 'application/json', 200)
 
   return _handler
 
 
+def _read_file(path: Text) -> bytes:
+  """Read the full contents of a file, in a single call."""
+  with open(path, 'rb') as fd:
+    return fd.read()
+
+
 class LitApp(object):
   """LIT WSGI application."""
 
@@ -98,8 +106,8 @@ class LitApp(object):
         logging.error("Error: model '%s' has no compatible datasets!", name)
       # TODO(lit-team): check generator and interpreter compatibility
       # with models, or just do this on frontend?
-      info['generators'] = list(self._generators.keys())
-      info['interpreters'] = list(self._interpreters.keys())
+      info['generators'] = list(self._generators)
+      info['interpreters'] = list(self._interpreters)
       info['description'] = m.description()
       info_by_model[name] = info
 
@@ -110,15 +118,15 @@ class LitApp(object):
           'description': ds.description(),
       }
     generator_info = {}
-    for gen_name in self._generators.keys():
-      generator_info[gen_name] = self._generators[gen_name].spec()
+    for gen_name, gen in self._generators.items():
+      generator_info[gen_name] = gen.spec()
 
     self._info = {
         'models': info_by_model,
         'datasets': info_by_dataset,
         # TODO(lit-team): return more spec information here?
         'generators': generator_info,
-        'interpreters': list(self._interpreters.keys()),
+        'interpreters': list(self._interpreters),
         'demoMode': self._demo_mode,
         'defaultLayout': self._default_layout,
         'canonicalURL': self._canonical_url,
@@ -144,8 +152,7 @@ class LitApp(object):
       return None
     data = data['inputs']
     timestr = time.strftime('%Y%m%d-%H%M%S')
-    file_name = dataset_name + '_' + timestr + '.pkl'
-    new_file_path = os.path.join(path, file_name)
+    new_file_path = os.path.join(path, f'{dataset_name}_{timestr}.pkl')
     with open(new_file_path, 'wb') as fd:
       pickle.dump(data, fd)
     return new_file_path
@@ -156,12 +163,32 @@ class LitApp(object):
     if self._demo_mode:
       logging.warn('Attempted to load datapoints in demo mode.')
       return None
-    search_path = os.path.join(path, dataset_name) + '*.pkl'
+    # As with glob, a missing directory just means there's nothing to load.
+    if not os.path.isdir(path):
+      return []
+    # Match files by name directly rather than via glob, which also avoids
+    # treating characters in the dataset name as wildcards.
+    with os.scandir(path) as it:
+      files = [
+          entry.path for entry in it
+          if entry.name.startswith(dataset_name) and
+          entry.name.endswith('.pkl') and entry.is_file()
+      ]
+    if len(files) <= 1:
+      return list(pickle.loads(_read_file(files[0]))) if files else []
+    # Read files in parallel, since this is I/O bound, and unpickle each one on
+    # this thread in the original file order. At most max_workers reads are in
+    # flight, so only that many files' bytes are held in memory at once.
     datapoints = []
-    files = glob.glob(search_path)
-    for file_path in files:
-      with open(file_path, 'rb') as fd:
-        datapoints.extend(pickle.load(fd))
+    max_workers = min(32, len(files))
+    pending = collections.deque()
+    with futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+      for file_path in files:
+        if len(pending) == max_workers:
+          datapoints.extend(pickle.loads(pending.popleft().result()))
+        pending.append(pool.submit(_read_file, file_path))
+      while pending:
+        datapoints.extend(pickle.loads(pending.popleft().result()))
     return datapoints
 
   def _get_preds(self,
@@ -203,10 +230,10 @@ class LitApp(object):
 
   def _get_datapoint_ids(self, data):
     """Fill in unique example hashes for the provided datapoints."""
-    examples = []
-    for example in data['inputs']:
+    # Ids are filled in place, so there's no need to build a second list.
+    examples = data['inputs']
+    for example in examples:
       example['id'] = caching.input_hash(example['data'])
-      examples.append(example)
     return examples
 
   def _get_dataset(self, unused_data, dataset_name: Text = None):
@@ -216,7 +243,17 @@ class LitApp(object):
     # passed from the frontend?
     assert dataset_name is not None, 'No dataset specified.'
     # TODO(lit-team): possibly allow IDs from persisted dataset.
-    return caching.add_hashes_to_input(self._datasets[dataset_name].examples)
+    # Hashing every example is expensive, so reuse the indexed examples as
+    # long as the dataset returns the same examples list. Datasets which
+    # compute examples on the fly, or entries replaced in self._datasets, are
+    # re-indexed; this assumes a list is not modified in place once returned.
+    examples = self._datasets[dataset_name].examples
+    cached = self._indexed_datasets.get(dataset_name)
+    if cached is not None and cached[0] is examples:
+      return cached[1]
+    indexed_examples = caching.add_hashes_to_input(examples)
+    self._indexed_datasets[dataset_name] = (examples, indexed_examples)
+    return indexed_examples
 
   def _get_generated(self, data, model: Text, dataset_name: Text,
                      generator: Text, **unused_kw):
@@ -305,6 +342,10 @@ class LitApp(object):
     }
     self._datasets = datasets
     self._datasets['_union_empty'] = NoneDataset(self._models)
+    # (examples, indexed examples) by dataset name, filled by _get_dataset().
+    # This holds the indexed examples of each requested dataset for the
+    # lifetime of the app.
+    self._indexed_datasets = {}
     if generators is not None:
       self._generators = generators
     else:
@@ -394,10 +435,14 @@ class NoneDataset(lit_dataset.Dataset):
   def __init__(self, models):
     self._examples = []
     self._models = models
+    self._spec = None  # computed on first call to spec()
 
   def spec(self):
+    if self._spec is not None:
+      return self._spec
+
     combined_spec = {}
-    for _, model in self._models.items():
+    for model in self._models.values():
       req_inputs = {
           k: v for (k, v) in model.spec().input.items() if v.required
       }
@@ -405,10 +450,8 @@ class NoneDataset(lit_dataset.Dataset):
       assert not self.has_conflicting_keys(combined_spec, req_inputs)
       combined_spec.update(req_inputs)
 
+    self._spec = combined_spec
     return combined_spec
 
   def has_conflicting_keys(self, spec0: types.Spec, spec1: types.Spec):
-    for k, v in spec0.items():
-      if k in spec1 and spec1[k] != v:
-        return True
-    return False
+    return any(spec0[k] != spec1[k] for k in spec0.keys() & spec1.keys())
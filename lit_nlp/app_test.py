@@ -0,0 +1,93 @@
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+# Lint as: python3
+"""Tests for lit_nlp.app."""
+
+import os
+import pickle
+import tempfile
+
+from absl.testing import absltest
+from lit_nlp import app as lit_app
+from lit_nlp.api import dataset as lit_dataset
+
+
+class LoadDatapointsTest(absltest.TestCase):
+
+  def setUp(self):
+    super().setUp()
+    self.app = lit_app.LitApp({}, {}, client_root=self._make_tempdir())
+
+  def _make_tempdir(self):
+    tempdir = tempfile.TemporaryDirectory()
+    self.addCleanup(tempdir.cleanup)
+    return tempdir.name
+
+  def _write(self, dir_path, file_name, data):
+    with open(os.path.join(dir_path, file_name), 'wb') as fd:
+      pickle.dump(data, fd)
+
+  def test_load_datapoints_filters_files(self):
+    dir_path = self._make_tempdir()
+    self._write(dir_path, 'sst_1.pkl', [{'x': 1}])
+    self._write(dir_path, 'sst_2.pkl', [{'x': 2}, {'x': 3}])
+    self._write(dir_path, 'other_1.pkl', [{'x': 4}])
+    self._write(dir_path, 'sst_3.txt', [{'x': 5}])
+    os.mkdir(os.path.join(dir_path, 'sst_dir.pkl'))
+    datapoints = self.app._load_datapoints(None, 'sst', dir_path)
+    self.assertCountEqual([{'x': 1}, {'x': 2}, {'x': 3}], datapoints)
+
+  def test_load_datapoints_many_files(self):
+    dir_path = self._make_tempdir()
+    for i in range(50):
+      self._write(dir_path, f'sst_{i}.pkl', [{'x': i}, {'x': -i}])
+    datapoints = self.app._load_datapoints(None, 'sst', dir_path)
+    expected = [{'x': i} for i in range(50)] + [{'x': -i} for i in range(50)]
+    self.assertCountEqual(expected, datapoints)
+
+  def test_load_datapoints_round_trip(self):
+    dir_path = self._make_tempdir()
+    inputs = [{'data': {'text': 'a'}, 'id': 'foo'}]
+    self.app._save_datapoints({'inputs': inputs}, 'sst', dir_path)
+    self.assertEqual(inputs, self.app._load_datapoints(None, 'sst', dir_path))
+
+  def test_load_datapoints_missing_dir(self):
+    dir_path = os.path.join(self._make_tempdir(), 'missing')
+    self.assertEqual([], self.app._load_datapoints(None, 'sst', dir_path))
+
+
+class GetDatasetTest(absltest.TestCase):
+
+  def setUp(self):
+    super().setUp()
+    tempdir = tempfile.TemporaryDirectory()
+    self.addCleanup(tempdir.cleanup)
+    self.datasets = {'foo': lit_dataset.Dataset({}, [{'a': 1}])}
+    self.app = lit_app.LitApp({}, self.datasets, client_root=tempdir.name)
+
+  def test_get_dataset_reuses_index(self):
+    indexed = self.app._get_dataset(None, 'foo')
+    self.assertEqual([{'a': 1}], [ex['data'] for ex in indexed])
+    self.assertIs(indexed, self.app._get_dataset(None, 'foo'))
+
+  def test_get_dataset_replaced(self):
+    self.app._get_dataset(None, 'foo')
+    self.datasets['foo'] = lit_dataset.Dataset({}, [{'a': 2}])
+    indexed = self.app._get_dataset(None, 'foo')
+    self.assertEqual([{'a': 2}], [ex['data'] for ex in indexed])
+
+
+if __name__ == '__main__':
+  absltest.main()
@@ -0,0 +1,81 @@
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+# Lint as: python3
+"""Tests for lit_nlp.lib.serialize."""
+
+import json
+
+from absl.testing import absltest
+from lit_nlp.api import dtypes
+from lit_nlp.api import types
+from lit_nlp.lib import serialize
+import numpy as np
+
+
+class SerializeTest(absltest.TestCase):
+
+  def test_to_json_simple(self):
+    obj = {
+        "array": np.array([[1.0, 2.5], [3.0, 4.0]], dtype=np.float32),
+        "strided": np.arange(6)[::2],
+        "scalar": np.float32(0.5),
+        "tuple": ("a", 1),
+        "spec": types.TextSegment(),
+        "span": dtypes.SpanLabel(start=0, end=2, label="x"),
+        "text": "żółw",
+        3: "int key",
+    }
+    expected = json.dumps(obj, cls=serialize.SimpleJSONEncoder)
+    self.assertEqual(
+        json.loads(expected), json.loads(serialize.to_json(obj, simple=True)))
+
+  def test_to_json_simple_orjson_fallback(self):
+    if serialize.orjson is None:
+      self.skipTest("orjson is not installed")
+    # Integers beyond 64 bits aren't supported by orjson.
+    obj = {"big": 2**70, "array": np.array([1, 2])}
+    self.assertEqual('{"big": 1180591620717411303424, "array": [1, 2]}',
+                     serialize.to_json(obj, simple=True))
+
+  def test_to_json_simple_orjson_differences(self):
+    if serialize.orjson is None:
+      self.skipTest("orjson is not installed")
+    # These differences from the built-in encoder are documented in to_json.
+    self.assertEqual('{"a":null,"b":0.1}',
+                     serialize.to_json({"a": float("nan"),
+                                        "b": np.float32(0.1)}, simple=True))
+
+  def test_to_json_bytes(self):
+    obj = {"array": np.array([1, 2]), "text": "żółw", "big": 2**70}
+    for simple in [True, False]:
+      self.assertEqual(
+          serialize.to_json(obj, simple=simple).encode("utf-8"),
+          serialize.to_json_bytes(obj, simple=simple))
+
+  def test_to_json_sort_keys(self):
+    # Extra json_kw always use the built-in encoder, so hashes are stable.
+    obj = {"b": 1, "a": [1, 2]}
+    self.assertEqual('{"a": [1, 2], "b": 1}',
+                     serialize.to_json(obj, simple=True, sort_keys=True))
+
+  def test_round_trip(self):
+    obj = {"array": np.array([1, 2, 3]), "spec": types.Scalar()}
+    result = serialize.from_json(serialize.to_json(obj))
+    np.testing.assert_array_equal(obj["array"], result["array"])
+    self.assertEqual(obj["spec"], result["spec"])
+
+
+if __name__ == "__main__":
+  absltest.main()